@@ -8,6 +8,9 @@ All agents use deterministic logic (no LLM) for Phase 1 validation.
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from functools import lru_cache
+from itertools import product
 from typing import Protocol, runtime_checkable
 
 from dragonfly.core.types import (
@@ -34,6 +37,39 @@ DECREASE_KEYWORDS = frozenset([
     "decrease", "drop", "fall", "down", "lower", "less", "shrink", "decline",
 ])
 
+# Keyword categories reported by _keyword_flags, as bits of an int mask
+_DEADLINE = 1
+_INCREASE = 2
+_DECREASE = 4
+
+# Keyword sets as tuples, paired with the bit each one sets
+_KEYWORD_GROUPS: tuple[tuple[int, tuple[str, ...]], ...] = (
+    (_DEADLINE, tuple(DEADLINE_KEYWORDS)),
+    (_INCREASE, tuple(INCREASE_KEYWORDS)),
+    (_DECREASE, tuple(DECREASE_KEYWORDS)),
+)
+
+
+@lru_cache(maxsize=1024)
+def _keyword_flags(content: str) -> int:
+    """Classify text against all keyword sets in a single pass.
+
+    The text is lowercased once and each keyword set is scanned until its
+    first hit. Results are memoized on the text itself, so the agents that
+    inspect the same observation share one classification.
+
+    Returns:
+        Bitmask of _DEADLINE, _INCREASE and _DECREASE
+    """
+    content_lower = content.lower()
+    flags = 0
+    for bit, keywords in _KEYWORD_GROUPS:
+        for keyword in keywords:
+            if keyword in content_lower:
+                flags |= bit
+                break
+    return flags
+
 
 @runtime_checkable
 class EpistemicNode(Protocol):
@@ -72,10 +108,15 @@ class ConstraintAgent:
         - Irreversible actions in high-stakes situations
         """
         assessments: list[Assessment] = []
+        created_at = datetime.now(UTC)  # Shared by every assessment in this pass
 
         # Check for deadline constraints
         has_deadline = self._has_deadline_indicator(situation)
 
+        # Every deadline violation cites all observations; collect the ids once
+        # and give each assessment its own copy, since assessments are mutable
+        deadline_support = [obs.id for obs in situation.observations] if has_deadline else []
+
         for action in situation.candidate_actions:
             # Check deadline vs flexible time sensitivity
             if has_deadline and action.time_sensitivity == "flexible":
@@ -84,12 +125,13 @@ class ConstraintAgent:
                         situation_id=situation.id,
                         agent_type=self.agent_type,
                         claim=f"Action '{action.name}' may miss deadline due to flexible timing",
-                        support=[obs.id for obs in situation.observations],
+                        support=list(deadline_support),
                         confidence="high",
                         severity="high",
                         reversibility="irreversible",
                         is_hard_constraint=True,
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
 
@@ -106,6 +148,7 @@ class ConstraintAgent:
                         reversibility="irreversible",
                         is_hard_constraint=False,  # Warning, not hard constraint
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
 
@@ -122,6 +165,7 @@ class ConstraintAgent:
                         reversibility="irreversible",
                         is_hard_constraint=False,
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
 
@@ -129,12 +173,7 @@ class ConstraintAgent:
 
     def _has_deadline_indicator(self, situation: Situation) -> bool:
         """Check if any observation indicates a deadline."""
-        for obs in situation.observations:
-            content_lower = obs.content.lower()
-            for keyword in DEADLINE_KEYWORDS:
-                if keyword in content_lower:
-                    return True
-        return False
+        return any(_keyword_flags(obs.content) & _DEADLINE for obs in situation.observations)
 
 
 class StabilityAgent:
@@ -163,6 +202,7 @@ class StabilityAgent:
         warning about actions that reduce future optionality.
         """
         assessments: list[Assessment] = []
+        created_at = datetime.now(UTC)  # Shared by every assessment in this pass
 
         for action in situation.candidate_actions:
             severity = self.REVERSIBILITY_SEVERITY.get(action.reversibility, "medium")
@@ -183,6 +223,7 @@ class StabilityAgent:
                         reversibility="irreversible",
                         is_hard_constraint=False,
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
             elif action.reversibility == "costly":
@@ -197,6 +238,7 @@ class StabilityAgent:
                         reversibility="costly",
                         is_hard_constraint=False,
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
             else:
@@ -212,6 +254,7 @@ class StabilityAgent:
                         reversibility="reversible",
                         is_hard_constraint=False,
                         action_id=action.id,
+                        created_at=created_at,
                     )
                 )
 
@@ -241,6 +284,7 @@ class RealityCheckAgent:
         - Insufficient information
         """
         assessments: list[Assessment] = []
+        created_at = datetime.now(UTC)  # Shared by every assessment in this pass
 
         # Check for low reliability in high stakes
         for obs in situation.observations:
@@ -257,6 +301,7 @@ class RealityCheckAgent:
                         reversibility="reversible",
                         is_hard_constraint=False,
                         recommended_tests=[f"Verify information from {obs.source}"],
+                        created_at=created_at,
                     )
                 )
 
@@ -274,6 +319,7 @@ class RealityCheckAgent:
                     reversibility="reversible",
                     is_hard_constraint=False,
                     recommended_tests=["Gather additional data to resolve conflict"],
+                    created_at=created_at,
                 )
             )
 
@@ -290,6 +336,7 @@ class RealityCheckAgent:
                     reversibility="reversible",
                     is_hard_constraint=False,
                     recommended_tests=["Gather relevant observations before deciding"],
+                    created_at=created_at,
                 )
             )
 
@@ -303,26 +350,20 @@ class RealityCheckAgent:
         Uses simple keyword-based conflict detection:
         - Observations predicting increase vs. decrease
         """
-        conflicts: list[tuple] = []
-
         # Group observations by directional content
         increase_obs = []
         decrease_obs = []
 
         for obs in observations:
-            content_lower = obs.content.lower()
+            direction = _keyword_flags(obs.content) & (_INCREASE | _DECREASE)
 
-            has_increase = any(kw in content_lower for kw in INCREASE_KEYWORDS)
-            has_decrease = any(kw in content_lower for kw in DECREASE_KEYWORDS)
-
-            if has_increase and not has_decrease:
+            if direction == _INCREASE:
                 increase_obs.append(obs)
-            elif has_decrease and not has_increase:
+            elif direction == _DECREASE:
                 decrease_obs.append(obs)
 
-        # If we have both increase and decrease predictions, they conflict
-        for inc_obs in increase_obs:
-            for dec_obs in decrease_obs:
-                conflicts.append((inc_obs, dec_obs))
+        if not increase_obs or not decrease_obs:
+            return []
 
-        return conflicts
+        # If we have both increase and decrease predictions, they conflict
+        return list(product(increase_obs, decrease_obs))
@@ -11,6 +11,9 @@ The synthesis asks "which actions survive disagreement?" not "which model is tru
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from uuid import UUID
+
 from dragonfly.core.types import (
     ActionSpec,
     Assessment,
@@ -34,9 +37,61 @@ SEVERITY_WEIGHTS: dict[str, float] = {
 }
 
 
+def index_assessments(
+    assessments: Sequence[Assessment],
+) -> tuple[set[UUID], dict[UUID, float]]:
+    """Split action-level assessments into violations and warning penalties.
+
+    Built in a single pass once per synthesis, so that filtering and
+    scoring are set/dict lookups rather than scans over every assessment.
+    Warning severities are converted to weights here, as they are read.
+
+    Args:
+        assessments: List of assessments from all agents
+
+    Returns:
+        Tuple of (IDs of actions violating a hard constraint,
+        total warning penalty per action)
+    """
+    severity_weight = SEVERITY_WEIGHTS.get
+    violated_action_ids: set[UUID] = set()
+    warning_penalties: dict[UUID, float] = {}
+    for a in assessments:
+        action_id = a.action_id
+        if action_id is None:
+            continue
+        if a.is_hard_constraint:
+            violated_action_ids.add(action_id)
+        else:
+            warning_penalties[action_id] = (
+                warning_penalties.get(action_id, 0.0) + severity_weight(a.severity, 0.2)
+            )
+    return violated_action_ids, warning_penalties
+
+
+def filter_violated(
+    actions: Sequence[ActionSpec],
+    violated_action_ids: set[UUID],
+) -> list[ActionSpec]:
+    """Filter out actions with a hard constraint violation.
+
+    Args:
+        actions: List of candidate actions
+        violated_action_ids: Action IDs with hard constraint violations
+            (see index_assessments)
+
+    Returns:
+        List of actions that don't violate any hard constraints
+    """
+    return [
+        action for action in actions
+        if action.id not in violated_action_ids
+    ]
+
+
 def filter_by_constraints(
-    actions: list[ActionSpec],
-    assessments: list[Assessment],
+    actions: Sequence[ActionSpec],
+    assessments: Sequence[Assessment],
 ) -> list[ActionSpec]:
     """Filter out actions that violate hard constraints.
 
@@ -47,30 +102,47 @@ def filter_by_constraints(
     Returns:
         List of actions that don't violate any hard constraints
     """
-    # Find action IDs with hard constraint violations
-    violated_action_ids = {
-        a.action_id
-        for a in assessments
-        if a.is_hard_constraint and a.action_id is not None
-    }
-
-    # Return actions that aren't violated
+    violated_action_ids, _ = index_assessments(assessments)
+    return filter_violated(actions, violated_action_ids)
+
+
+def score_actions(
+    actions: Sequence[ActionSpec],
+    warning_penalties: dict[UUID, float],
+) -> list[float]:
+    """Calculate robustness scores for a batch of actions.
+
+    Score components:
+    - Reversibility (60% weight): reversible > costly > irreversible
+    - Warning penalty (40% weight): fewer/milder warnings = better
+
+    The whole batch is scored in one comprehension with the lookup tables
+    bound once, rather than paying a function call per action.
+
+    Args:
+        actions: Actions to score
+        warning_penalties: Warning penalty per action (see index_assessments)
+
+    Returns:
+        Robustness scores in range [0.0, 1.0], in the order of actions
+    """
+    reversibility_score = REVERSIBILITY_SCORES.get
+    warning_penalty = warning_penalties.get
+
+    # 60% reversibility, 40% constraint satisfaction (penalty clamped to [0, 1])
     return [
-        action for action in actions
-        if action.id not in violated_action_ids
+        0.6 * reversibility_score(action.reversibility, 0.5)
+        + 0.4 * max(0.0, 1.0 - warning_penalty(action.id, 0.0))
+        for action in actions
     ]
 
 
 def score_robustness(
     action: ActionSpec,
-    assessments: list[Assessment],
+    assessments: Sequence[Assessment],
 ) -> float:
     """Calculate robustness score for an action.
 
-    Score components:
-    - Reversibility (60% weight): reversible > costly > irreversible
-    - Warning penalty (40% weight): fewer/milder warnings = better
-
     Args:
         action: Action to score
         assessments: List of assessments (may include ones for other actions)
@@ -78,33 +150,37 @@ def score_robustness(
     Returns:
         Robustness score in range [0.0, 1.0]
     """
-    # Reversibility component (0-1)
-    rev_score = REVERSIBILITY_SCORES.get(action.reversibility, 0.5)
-
-    # Warning penalty component
-    # Get warnings for this specific action
-    action_warnings = [
-        a for a in assessments
-        if a.action_id == action.id and not a.is_hard_constraint
-    ]
+    _, warning_penalties = index_assessments(assessments)
+    return score_actions([action], warning_penalties)[0]
 
-    # Calculate total penalty from warnings
-    warning_penalty = sum(
-        SEVERITY_WEIGHTS.get(w.severity, 0.2)
-        for w in action_warnings
-    )
 
-    # Clamp to [0, 1] range
-    constraint_score = max(0.0, 1.0 - warning_penalty)
+def select_best(
+    actions: Sequence[ActionSpec],
+    warning_penalties: dict[UUID, float],
+) -> tuple[ActionSpec, float]:
+    """Select the best action based on robustness scores.
+
+    Args:
+        actions: List of candidate actions (should be non-empty)
+        warning_penalties: Warning penalty per action (see index_assessments)
 
-    # Combined score with weights
-    # 60% reversibility, 40% constraint satisfaction
-    return 0.6 * rev_score + 0.4 * constraint_score
+    Returns:
+        The action with the highest robustness score (earliest wins ties)
+        and its score
+    """
+    if not actions:
+        raise ValueError("Cannot select from empty action list")
+
+    scores = score_actions(actions, warning_penalties)
+
+    # max() returns the first maximal index, so ties keep original order
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return actions[best], scores[best]
 
 
 def select_action(
-    actions: list[ActionSpec],
-    assessments: list[Assessment],
+    actions: Sequence[ActionSpec],
+    assessments: Sequence[Assessment],
 ) -> ActionSpec:
     """Select the best action based on robustness scores.
 
@@ -115,20 +191,12 @@ def select_action(
     Returns:
         The action with the highest robustness score
     """
-    if not actions:
-        raise ValueError("Cannot select from empty action list")
-
-    # Score all actions
-    scored = [(action, score_robustness(action, assessments)) for action in actions]
-
-    # Sort by score (descending), then by original order for ties
-    scored.sort(key=lambda x: (-x[1], actions.index(x[0])))
-
-    return scored[0][0]
+    _, warning_penalties = index_assessments(assessments)
+    return select_best(actions, warning_penalties)[0]
 
 
 def generate_monitoring(
-    assessments: list[Assessment],
+    assessments: Sequence[Assessment],
 ) -> list[MonitoringTrigger]:
     """Generate monitoring triggers from high-severity assessments.
 
@@ -153,7 +221,7 @@ def generate_monitoring(
     return triggers
 
 
-def _find_most_reversible(actions: list[ActionSpec]) -> ActionSpec:
+def _find_most_reversible(actions: Sequence[ActionSpec]) -> ActionSpec:
     """Find the most reversible action from a list.
 
     Used as fallback when no actions survive constraints.
@@ -170,9 +238,21 @@ def _find_most_reversible(actions: list[ActionSpec]) -> ActionSpec:
     return sorted_actions[0]
 
 
+def _alternatives(actions: list[ActionSpec], selected: ActionSpec) -> list[ActionSpec]:
+    """Return all actions except the selected one, preserving order.
+
+    The selected action is always drawn from the candidate list, so it is
+    located by identity and sliced out rather than comparing every ID.
+    """
+    for i, action in enumerate(actions):
+        if action is selected:
+            return actions[:i] + actions[i + 1:]
+    return list(actions)
+
+
 def synthesize(
     situation: Situation,
-    assessments: list[Assessment],
+    assessments: Sequence[Assessment],
 ) -> Decision:
     """Synthesize a decision from situation and assessments.
 
@@ -189,11 +269,10 @@ def synthesize(
     Returns:
         A Decision object with the selected action and rationale
     """
-    # Filter by hard constraints
-    surviving_actions = filter_by_constraints(
-        situation.candidate_actions,
-        assessments,
-    )
+    candidates = situation.candidate_actions
+
+    # Split assessments into hard constraint violations and warning penalties
+    violated_action_ids, warning_penalties = index_assessments(assessments)
 
     # Generate monitoring triggers
     monitoring = generate_monitoring(assessments)
@@ -201,31 +280,33 @@ def synthesize(
     # Collect assessment IDs used
     assessments_used = [a.id for a in assessments]
 
-    # Determine alternatives (all except selected)
-    if surviving_actions:
-        # Select best action from survivors
-        selected_action = select_action(surviving_actions, assessments)
-        score = score_robustness(selected_action, assessments)
-
-        alternatives = [
-            a for a in situation.candidate_actions
-            if a.id != selected_action.id
-        ]
-
+    score = 0.0
+    if len(candidates) == 1:
+        # A lone candidate is selected either way: skip filtering and ranking
+        selected_action = candidates[0]
+        passed = selected_action.id not in violated_action_ids
+        if passed:
+            score = score_actions([selected_action], warning_penalties)[0]
+        alternatives: list[ActionSpec] = []
+    else:
+        # Filter by hard constraints
+        surviving_actions = filter_violated(candidates, violated_action_ids)
+        passed = bool(surviving_actions)
+        if passed:
+            # Select best action from survivors
+            selected_action, score = select_best(surviving_actions, warning_penalties)
+        else:
+            # No actions survive - select most reversible as fallback
+            selected_action = _find_most_reversible(candidates)
+        alternatives = _alternatives(candidates, selected_action)
+
+    if passed:
         robustness_basis = (
             f"Passed all hard constraints. "
             f"Selected '{selected_action.name}' with robustness score {score:.2f}. "
             f"Action is {selected_action.reversibility}."
         )
     else:
-        # No actions survive - select most reversible as fallback
-        selected_action = _find_most_reversible(situation.candidate_actions)
-        
-        alternatives = [
-            a for a in situation.candidate_actions
-            if a.id != selected_action.id
-        ]
-
         robustness_basis = (
             f"No action passed all hard constraints. "
             f"Selected '{selected_action.name}' as most reversible fallback option."
@@ -28,7 +28,7 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """A single observation about the world.
 
@@ -64,7 +64,7 @@ class Observation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionSpec:
     """A candidate action that could be taken.
 
@@ -100,7 +100,7 @@ class ActionSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Situation:
     """The complete context for a decision.
 
@@ -149,7 +149,7 @@ class Situation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Assessment:
     """Output from an epistemic agent.
 
@@ -206,7 +206,7 @@ class Assessment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MonitoringTrigger:
     """A condition to watch that could trigger re-planning.
 
@@ -233,7 +233,7 @@ class MonitoringTrigger:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """The output of the synthesis process.
 
@@ -3,24 +3,46 @@
 Run with: uvicorn dragonfly.service.api.main:app --reload
 """
 
-from fastapi import FastAPI
+from typing import Any
 
-from dragonfly.service.api.routes import router
+import orjson
+from fastapi import FastAPI, Response
+
+from dragonfly.service.api.orjson_response import ORJSONResponse
+from dragonfly.service.api.routes import API_SCHEMAS, router
 
 app = FastAPI(
     title="Dragonfly Agent Framework",
     description="Multi-perspective decision-making agent framework",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(router, prefix="/api/v1")
 
+_fastapi_openapi = app.openapi
+
+
+def _openapi() -> dict[str, Any]:
+    """Generate the OpenAPI schema, adding the msgspec API schemas."""
+    if app.openapi_schema is None:
+        schema = _fastapi_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(API_SCHEMAS)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
+
+
+# API info never changes, so serialize it once
+_ROOT_BODY = orjson.dumps({
+    "name": "Dragonfly Agent Framework",
+    "version": "0.1.0",
+    "docs": "/docs",
+})
+
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint with API info."""
-    return {
-        "name": "Dragonfly Agent Framework",
-        "version": "0.1.0",
-        "docs": "/docs",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
@@ -0,0 +1,23 @@
+"""orjson-backed JSON response for the Dragonfly API.
+
+FastAPI's bundled ORJSONResponse is deprecated, so the service carries its
+own. orjson serializes dataclasses, UUIDs and datetimes natively, so
+handlers can return core data without converting it to strings first.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return orjson.dumps(content)
@@ -1,93 +1,199 @@
 """FastAPI routes for the Dragonfly Agent Framework.
 
 This module provides the HTTP API endpoints for the decision service.
+
+Request and response models are msgspec Structs. Requests are decoded
+straight from the raw body; response models only document the payloads
+that handlers build as dicts.
 """
 
 from __future__ import annotations
 
+import re
+from datetime import UTC, datetime
 from typing import Any
+from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import msgspec
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 
 from dragonfly.core.types import (
     ActionSpec,
     Decision,
     Observation,
+    Reliability,
+    Reversibility,
     Situation,
+    Stakes,
+    TimeHorizon,
+    TimeSensitivity,
+    TriggerAction,
 )
+from dragonfly.service.api.orjson_response import ORJSONResponse
 from dragonfly.service.runtime.langgraph_runner import get_runner
 
 
 router = APIRouter()
 
 
-class ObservationRequest(BaseModel):
+class ObservationRequest(msgspec.Struct, frozen=True):
     """Request model for an observation."""
 
     content: str
     source: str
-    reliability: str  # "low" | "medium" | "high"
+    reliability: Reliability
 
 
-class ActionSpecRequest(BaseModel):
+class ActionSpecRequest(msgspec.Struct, frozen=True):
     """Request model for an action specification."""
 
     name: str
     description: str
-    reversibility: str  # "reversible" | "costly" | "irreversible"
-    time_sensitivity: str | None = None  # "immediate" | "near" | "flexible"
+    reversibility: Reversibility
+    time_sensitivity: TimeSensitivity | None = None
 
 
-class SituationRequest(BaseModel):
+class SituationRequest(msgspec.Struct, frozen=True):
     """Request model for a decision situation."""
 
     tenant_id: str
     goal: str
-    time_horizon: str  # "immediate" | "near" | "long"
-    stakes: str  # "low" | "medium" | "high"
+    time_horizon: TimeHorizon
+    stakes: Stakes
     observations: list[ObservationRequest]
     candidate_actions: list[ActionSpecRequest]
     context: dict[str, Any] = {}
 
 
-class MonitoringTriggerResponse(BaseModel):
+class MonitoringTriggerResponse(msgspec.Struct, frozen=True):
     """Response model for a monitoring trigger."""
 
     condition: str
-    action_on_trigger: str
+    action_on_trigger: TriggerAction
 
 
-class ActionSpecResponse(BaseModel):
+class ActionSpecResponse(msgspec.Struct, frozen=True):
     """Response model for an action specification."""
 
-    id: str
+    id: UUID
     name: str
     description: str
-    reversibility: str
-    time_sensitivity: str | None = None
+    reversibility: Reversibility
+    time_sensitivity: TimeSensitivity | None = None
 
 
-class DecisionResponse(BaseModel):
+class DecisionResponse(msgspec.Struct, frozen=True):
     """Response model for a decision."""
 
-    id: str
-    situation_id: str
+    id: UUID
+    situation_id: UUID
     tenant_id: str
     selected_action: ActionSpecResponse
     alternatives_considered: list[ActionSpecResponse]
     robustness_basis: str
-    assessments_used: list[str]
+    assessments_used: list[UUID]
     monitoring: list[MonitoringTriggerResponse]
-    created_at: str
+    created_at: datetime
+
+
+# Reused decoders for /decide bodies (parse and validate in one step)
+_situation_decoder = msgspec.json.Decoder(SituationRequest)
+_situation_batch_decoder = msgspec.json.Decoder(list[SituationRequest])
 
+# OpenAPI schemas for the request and response Structs, registered by main.py
+(_situation_schema, _decision_schema), API_SCHEMAS = msgspec.json.schema_components(
+    (SituationRequest, DecisionResponse), ref_template="#/components/schemas/{name}"
+)
 
-def _observation_from_request(req: ObservationRequest) -> Observation:
+_SITUATION_REQUEST_BODY: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _situation_schema}},
+    },
+}
+
+# FastAPI's standard 422 body: {"detail": [{"loc": [...], "msg": ..., "type": ...}]}
+_VALIDATION_ERROR_RESPONSE: dict[str, Any] = {
+    "description": "Validation Error",
+    "content": {
+        "application/json": {
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "detail": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "loc": {
+                                    "type": "array",
+                                    "items": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+                                },
+                                "msg": {"type": "string"},
+                                "type": {"type": "string"},
+                            },
+                            "required": ["loc", "msg", "type"],
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+_DECISION_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "Successful Response",
+        "content": {"application/json": {"schema": _decision_schema}},
+    },
+    422: _VALIDATION_ERROR_RESPONSE,
+}
+
+# Largest batch /decide/batch accepts; bounds the work one request can queue
+MAX_BATCH_SIZE = 100
+
+_SITUATION_BATCH_REQUEST_BODY: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "array",
+                    "items": _situation_schema,
+                    "maxItems": MAX_BATCH_SIZE,
+                },
+            },
+        },
+    },
+}
+
+_DECISION_BATCH_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "Successful Response",
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": _decision_schema}},
+        },
+    },
+    413: {"description": f"Batch holds more than {MAX_BATCH_SIZE} situations"},
+    422: _VALIDATION_ERROR_RESPONSE,
+}
+
+# Splits a msgspec error message from its trailing " - at `$.path`" location
+_ERROR_LOCATION = re.compile(r"^(?P<msg>.*?)(?: - at `\$(?P<path>[^`]*)`)?$", re.DOTALL)
+_PATH_SEGMENT = re.compile(r"\.([^.\[]+)|\[([^\]]*)\]")
+_MISSING_FIELD = re.compile(r"^Object missing required field `([^`]+)`$")
+
+
+def _observation_from_request(req: ObservationRequest, received_at: datetime) -> Observation:
     """Convert request to core type."""
     return Observation(
         content=req.content,
         source=req.source,
         reliability=req.reliability,
+        timestamp=received_at,
     )
 
 
@@ -101,77 +207,182 @@ def _action_spec_from_request(req: ActionSpecRequest) -> ActionSpec:
     )
 
 
-def _decision_to_response(decision: Decision) -> DecisionResponse:
-    """Convert core Decision to response model."""
-    return DecisionResponse(
-        id=str(decision.id),
-        situation_id=str(decision.situation_id),
-        tenant_id=decision.tenant_id,
-        selected_action=ActionSpecResponse(
-            id=str(decision.selected_action.id),
-            name=decision.selected_action.name,
-            description=decision.selected_action.description,
-            reversibility=decision.selected_action.reversibility,
-            time_sensitivity=decision.selected_action.time_sensitivity,
-        ),
-        alternatives_considered=[
-            ActionSpecResponse(
-                id=str(action.id),
-                name=action.name,
-                description=action.description,
-                reversibility=action.reversibility,
-                time_sensitivity=action.time_sensitivity,
-            )
-            for action in decision.alternatives_considered
+def _situation_from_request(req: SituationRequest, received_at: datetime) -> Situation:
+    """Convert request to core type, stamped with a single clock read."""
+    return Situation(
+        tenant_id=req.tenant_id,
+        goal=req.goal,
+        time_horizon=req.time_horizon,
+        stakes=req.stakes,
+        observations=[_observation_from_request(o, received_at) for o in req.observations],
+        candidate_actions=[_action_spec_from_request(a) for a in req.candidate_actions],
+        context=req.context,
+        created_at=received_at,
+    )
+
+
+def _validation_error(e: msgspec.DecodeError) -> RequestValidationError:
+    """Convert a msgspec decode error to FastAPI's standard 422 error.
+
+    The location msgspec appends to its message (``$.observations[0]``)
+    becomes the ``loc`` of the error, under ``body`` as FastAPI reports it.
+    """
+    if not isinstance(e, msgspec.ValidationError):
+        return RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body",), "msg": str(e)}]
+        )
+
+    match = _ERROR_LOCATION.match(str(e))
+    msg = match["msg"]
+    loc: list[str | int] = ["body"]
+    for name, index in _PATH_SEGMENT.findall(match["path"] or ""):
+        loc.append(name or (int(index) if index.isdigit() else index))
+
+    missing = _MISSING_FIELD.match(msg)
+    if missing:
+        loc.append(missing[1])
+    error_type = "missing" if missing else "value_error"
+    return RequestValidationError([{"type": error_type, "loc": tuple(loc), "msg": msg}])
+
+
+def _use_cache(http_request: Request) -> bool:
+    """Whether memoized decisions may be reused (no Cache-Control: no-cache)."""
+    return "no-cache" not in http_request.headers.get("cache-control", "")
+
+
+def _action_spec_to_response(action: ActionSpec) -> dict[str, Any]:
+    """Convert core ActionSpec to its response payload."""
+    return {
+        "id": action.id,
+        "name": action.name,
+        "description": action.description,
+        "reversibility": action.reversibility,
+        "time_sensitivity": action.time_sensitivity,
+    }
+
+
+def _decision_to_response(decision: Decision) -> dict[str, Any]:
+    """Convert core Decision to its response payload (see DecisionResponse).
+
+    UUIDs and datetimes are left as-is; orjson renders them natively.
+    """
+    return {
+        "id": decision.id,
+        "situation_id": decision.situation_id,
+        "tenant_id": decision.tenant_id,
+        "selected_action": _action_spec_to_response(decision.selected_action),
+        "alternatives_considered": [
+            _action_spec_to_response(action) for action in decision.alternatives_considered
         ],
-        robustness_basis=decision.robustness_basis,
-        assessments_used=[str(a) for a in decision.assessments_used],
-        monitoring=[
-            MonitoringTriggerResponse(
-                condition=t.condition,
-                action_on_trigger=t.action_on_trigger,
-            )
+        "robustness_basis": decision.robustness_basis,
+        "assessments_used": decision.assessments_used,
+        "monitoring": [
+            {
+                "condition": t.condition,
+                "action_on_trigger": t.action_on_trigger,
+            }
             for t in decision.monitoring
         ],
-        created_at=decision.created_at.isoformat(),
-    )
+        "created_at": decision.created_at,
+    }
 
 
-@router.post("/decide", response_model=DecisionResponse)
-async def decide(request: SituationRequest) -> DecisionResponse:
+@router.post(
+    "/decide",
+    responses=_DECISION_RESPONSES,
+    openapi_extra=_SITUATION_REQUEST_BODY,
+)
+async def decide(http_request: Request) -> ORJSONResponse:
     """Process a decision request.
 
     Takes a situation with observations and candidate actions,
     runs it through the decision graph, and returns a Decision.
+
+    The body is decoded and validated by msgspec directly into a
+    SituationRequest; malformed or invalid bodies are rejected with 422,
+    in FastAPI's standard validation error format.
+    Repeated situations reuse a memoized decision unless the request
+    sends ``Cache-Control: no-cache``.
+
+    The payload is built directly from the core Decision and returned as
+    an ORJSONResponse; DecisionResponse documents its shape.
     """
+    try:
+        request = _situation_decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:
+        raise _validation_error(e) from e
+
     try:
         # Convert request to core types
-        observations = [_observation_from_request(o) for o in request.observations]
-        actions = [_action_spec_from_request(a) for a in request.candidate_actions]
-
-        situation = Situation(
-            tenant_id=request.tenant_id,
-            goal=request.goal,
-            time_horizon=request.time_horizon,
-            stakes=request.stakes,
-            observations=observations,
-            candidate_actions=actions,
-            context=request.context,
-        )
+        situation = _situation_from_request(request, datetime.now(UTC))
 
         # Run the decision graph
         runner = get_runner()
-        decision = runner.run(situation)
+        decision = runner.run(situation, use_cache=_use_cache(http_request))
+
+        return ORJSONResponse(_decision_to_response(decision))
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {e}") from e
+
+
+def _decide_all(requests: list[SituationRequest], use_cache: bool) -> list[dict[str, Any]]:
+    """Decide each situation of a batch in order (blocking)."""
+    # One clock read stamps the whole batch
+    received_at = datetime.now(UTC)
+    runner = get_runner()
+    return [
+        _decision_to_response(
+            runner.run(_situation_from_request(request, received_at), use_cache=use_cache)
+        )
+        for request in requests
+    ]
 
-        return _decision_to_response(decision)
+
+@router.post(
+    "/decide/batch",
+    responses=_DECISION_BATCH_RESPONSES,
+    openapi_extra=_SITUATION_BATCH_REQUEST_BODY,
+)
+async def decide_batch(http_request: Request) -> ORJSONResponse:
+    """Process a batch of decision requests.
+
+    Takes a list of situations and returns their Decisions in the same
+    order. Each situation is decided independently, exactly as by /decide,
+    so bulk clients (e.g. backtesting) pay one round trip per batch and
+    repeated situations within it share the decision cache.
+
+    Batches larger than MAX_BATCH_SIZE are rejected with 413. The batch is
+    decided in the threadpool, so it does not block the event loop.
+    """
+    try:
+        requests = _situation_batch_decoder.decode(await http_request.body())
+    except msgspec.DecodeError as e:
+        raise _validation_error(e) from e
+
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(requests)} situations exceeds the limit of {MAX_BATCH_SIZE}",
+        )
+
+    try:
+        decisions = await run_in_threadpool(_decide_all, requests, _use_cache(http_request))
+        return ORJSONResponse(decisions)
 
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Internal error: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal error: {e}") from e
+
+
+# Health checks are hit constantly and never change, so serialize once
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
 
 
 @router.get("/health")
-async def health() -> dict[str, str]:
+async def health() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
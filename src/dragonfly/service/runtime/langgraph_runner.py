@@ -1,14 +1,24 @@
 """LangGraph runner for the Dragonfly Agent Framework.
 
 This module provides the service-layer orchestration that executes
-the core decision graph using LangGraph for state management.
+the core decision graph. Phase 1 has no branching or checkpointing, so
+by default the agents and synthesis run as one direct pass; the LangGraph
+state graph is still available (and langgraph only imported) on request.
+
+Runners can memoize synthesis per situation content: a repeated situation
+is still assessed by every agent, but reuses the earlier synthesis, re-bound
+to the new situation's actions and assessments.
 """
 
 from __future__ import annotations
 
-from typing import TypedDict
+import operator
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import TYPE_CHECKING, Annotated, NamedTuple
 
-from langgraph.graph import StateGraph, END
+import msgspec
 
 from dragonfly.core.nodes import (
     ConstraintAgent,
@@ -19,51 +29,68 @@ from dragonfly.core.synth import synthesize
 from dragonfly.core.types import (
     Assessment,
     Decision,
+    MonitoringTrigger,
     Situation,
 )
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+# Agents are stateless assessors, so one instance of each serves every request
+_CONSTRAINT = ConstraintAgent()
+_STABILITY = StabilityAgent()
+_REALITY_CHECK = RealityCheckAgent()
 
-class DragonflyState(TypedDict):
+
+@dataclass(slots=True)
+class DragonflyState:
     """State container for the Dragonfly decision graph.
 
     Attributes:
         situation: The decision situation being processed
-        assessments: Accumulated assessments from all agents
+        assessments: Accumulated assessments from all agents (nodes return
+            only their own; the reducer appends them)
         decision: The final decision (set by synthesis node)
     """
 
     situation: Situation
-    assessments: list[Assessment]
-    decision: Decision | None
+    assessments: Annotated[list[Assessment], operator.add] = field(default_factory=list)
+    decision: Decision | None = None
 
 
 def _constraint_node(state: DragonflyState) -> dict:
     """Execute ConstraintAgent and add assessments to state."""
-    agent = ConstraintAgent()
-    new_assessments = agent.assess(state["situation"])
-    return {"assessments": state["assessments"] + new_assessments}
+    new_assessments = _CONSTRAINT.assess(state.situation)
+    return {"assessments": new_assessments}
 
 
 def _stability_node(state: DragonflyState) -> dict:
     """Execute StabilityAgent and add assessments to state."""
-    agent = StabilityAgent()
-    new_assessments = agent.assess(state["situation"])
-    return {"assessments": state["assessments"] + new_assessments}
+    new_assessments = _STABILITY.assess(state.situation)
+    return {"assessments": new_assessments}
 
 
 def _reality_check_node(state: DragonflyState) -> dict:
     """Execute RealityCheckAgent and add assessments to state."""
-    agent = RealityCheckAgent()
-    new_assessments = agent.assess(state["situation"])
-    return {"assessments": state["assessments"] + new_assessments}
+    new_assessments = _REALITY_CHECK.assess(state.situation)
+    return {"assessments": new_assessments}
 
 
 def _synthesis_node(state: DragonflyState) -> dict:
     """Execute synthesis and produce decision."""
-    decision = synthesize(state["situation"], state["assessments"])
+    decision = synthesize(state.situation, state.assessments)
     return {"decision": decision}
 
 
+def _assess(situation: Situation) -> list[Assessment]:
+    """Run every agent in graph order: constraint -> stability -> reality_check."""
+    return [
+        *_CONSTRAINT.assess(situation),
+        *_STABILITY.assess(situation),
+        *_REALITY_CHECK.assess(situation),
+    ]
+
+
 def _build_graph() -> StateGraph:
     """Build the LangGraph state graph for Phase 1.
 
@@ -74,6 +101,8 @@ def _build_graph() -> StateGraph:
     - reality_check -> synthesis
     - synthesis -> END
     """
+    from langgraph.graph import END, StateGraph
+
     # Create the graph with our state type
     graph = StateGraph(DragonflyState)
 
@@ -96,24 +125,137 @@ def _build_graph() -> StateGraph:
     return graph
 
 
+# Encodes cache keys; deterministic order makes equal contexts equal keys
+_key_encoder = msgspec.msgpack.Encoder(order="deterministic")
+
+
+def _situation_key(situation: Situation) -> bytes:
+    """Encode everything a decision depends on as a cache key.
+
+    Ids and timestamps are left out: they differ on every request and
+    do not influence the decision.
+
+    Raises:
+        TypeError: If the context holds values msgpack cannot encode
+    """
+    return _key_encoder.encode((
+        situation.tenant_id,
+        situation.goal,
+        situation.time_horizon,
+        situation.stakes,
+        [(o.content, o.source, o.reliability) for o in situation.observations],
+        [
+            (a.name, a.description, a.reversibility, a.time_sensitivity)
+            for a in situation.candidate_actions
+        ],
+        situation.context,
+    ))
+
+
+class _CachedDecision(NamedTuple):
+    """A synthesis recorded independently of the situation it was made for.
+
+    Actions are stored by their position in the candidate list, so the
+    decision can be re-bound to an identical situation with fresh ids.
+    Assessments are not stored: they carry their situation's id, so each
+    situation is assessed afresh and the replayed decision cites those.
+    """
+
+    selected: int
+    alternatives: tuple[int, ...]
+    robustness_basis: str
+    monitoring: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def record(cls, situation: Situation, decision: Decision) -> _CachedDecision:
+        """Record a decision made for situation."""
+        position = {id(a): i for i, a in enumerate(situation.candidate_actions)}
+        return cls(
+            selected=position[id(decision.selected_action)],
+            alternatives=tuple(position[id(a)] for a in decision.alternatives_considered),
+            robustness_basis=decision.robustness_basis,
+            monitoring=tuple((t.condition, t.action_on_trigger) for t in decision.monitoring),
+        )
+
+    def replay(self, situation: Situation, assessments: list[Assessment]) -> Decision:
+        """Build a new Decision (fresh id and timestamp) for situation.
+
+        Args:
+            situation: Situation with the same content as the recorded one
+            assessments: The agents' assessments of situation
+        """
+        actions = situation.candidate_actions
+        return Decision(
+            situation_id=situation.id,
+            tenant_id=situation.tenant_id,
+            selected_action=actions[self.selected],
+            alternatives_considered=[actions[i] for i in self.alternatives],
+            robustness_basis=self.robustness_basis,
+            assessments_used=[a.id for a in assessments],
+            monitoring=[
+                MonitoringTrigger(condition=condition, action_on_trigger=action_on_trigger)
+                for condition, action_on_trigger in self.monitoring
+            ],
+        )
+
+
+class _DecisionCache:
+    """Thread-safe LRU cache of recorded decisions."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, _CachedDecision] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: bytes) -> _CachedDecision | None:
+        """Return the entry for key (marking it recently used), if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: bytes, entry: _CachedDecision) -> None:
+        """Store an entry, evicting the least recently used beyond maxsize."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
 class DragonflyRunner:
     """Runner that executes the Dragonfly decision graph.
 
     This class provides the main entry point for running decisions
-    through the framework. It uses LangGraph for state management
-    but hides implementation details from callers.
+    through the framework. It hides implementation details from callers:
+    by default the agents are called directly, and with use_graph=True
+    the same steps run as a LangGraph state graph.
     """
 
-    def __init__(self) -> None:
-        """Initialize the runner with a compiled graph."""
-        graph = _build_graph()
-        self._app = graph.compile()
+    def __init__(self, use_graph: bool = False, cache_size: int = 0) -> None:
+        """Initialize the runner.
 
-    def run(self, situation: Situation) -> Decision:
+        Args:
+            use_graph: Execute through a compiled LangGraph graph instead of
+                the direct pass (for callers that need LangGraph features)
+            cache_size: Number of distinct situations whose synthesis is
+                memoized (0, the default, disables the cache)
+        """
+        self._app = _build_graph().compile() if use_graph else None
+        self._cache = _DecisionCache(cache_size) if cache_size > 0 else None
+
+    def run(self, situation: Situation, use_cache: bool = True) -> Decision:
         """Execute the decision graph for a situation.
 
+        With a cache, a situation with the same content as a recent one is
+        assessed by the agents as usual but reuses the earlier synthesis;
+        the returned Decision still has a fresh id and timestamp and refers
+        to this situation's actions and assessments.
+
         Args:
             situation: The decision situation to process
+            use_cache: Whether a memoized decision may be reused
 
         Returns:
             The Decision produced by synthesis
@@ -121,14 +263,30 @@ class DragonflyRunner:
         Raises:
             ValueError: If no decision is produced
         """
-        initial_state: DragonflyState = {
-            "situation": situation,
-            "assessments": [],
-            "decision": None,
-        }
+        if self._cache is None or not use_cache:
+            return self._execute(situation)
+
+        try:
+            key = _situation_key(situation)
+        except TypeError:
+            # Context holds values that cannot be keyed; decide uncached
+            return self._execute(situation)
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry.replay(situation, _assess(situation))
+
+        decision = self._execute(situation)
+        self._cache.put(key, _CachedDecision.record(situation, decision))
+        return decision
+
+    def _execute(self, situation: Situation) -> Decision:
+        """Run the agents and synthesis for a situation."""
+        if self._app is None:
+            return synthesize(situation, _assess(situation))
 
         # Execute the graph
-        result = self._app.invoke(initial_state)
+        result = self._app.invoke(DragonflyState(situation=situation))
 
         if result["decision"] is None:
             raise ValueError("Graph execution did not produce a decision")
@@ -136,13 +294,11 @@ class DragonflyRunner:
         return result["decision"]
 
 
-# Singleton runner instance
-_runner: DragonflyRunner | None = None
+# Singleton runner instance, built at import so workers pay for it at startup.
+# It serves the API, where repeated situations are common, so it memoizes.
+_runner = DragonflyRunner(cache_size=1024)
 
 
 def get_runner() -> DragonflyRunner:
-    """Get or create the singleton runner instance."""
-    global _runner
-    if _runner is None:
-        _runner = DragonflyRunner()
+    """Get the singleton runner instance."""
     return _runner
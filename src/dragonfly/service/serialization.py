@@ -0,0 +1,113 @@
+"""Serialization of core types for the service layer.
+
+Core types keep their stdlib ``to_dict``/``from_dict`` methods. At the
+service boundary they are encoded with orjson instead, which serializes
+dataclasses, UUIDs and datetimes natively, producing the same JSON as
+``to_dict`` without building the intermediate dicts. Decoding goes through
+msgspec, which parses and validates straight into the core dataclasses.
+
+For queues and storage, where payload size matters more than readability,
+core types are also written as length-prefixed MessagePack frames. Frames
+store UUIDs as their raw 16 bytes; frames holding canonical UUID strings
+still decode.
+"""
+
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+import msgspec
+import orjson
+
+from dragonfly.core.types import (
+    ActionSpec,
+    Assessment,
+    Decision,
+    MonitoringTrigger,
+    Observation,
+    Situation,
+)
+
+_CORE_TYPES = (Observation, ActionSpec, Situation, Assessment, MonitoringTrigger, Decision)
+
+# Decoders build their type schema on creation, so one per core type is reused
+_JSON_DECODERS: dict[type, msgspec.json.Decoder] = {
+    cls: msgspec.json.Decoder(cls) for cls in _CORE_TYPES
+}
+_MSGPACK_DECODERS: dict[type, msgspec.msgpack.Decoder] = {
+    cls: msgspec.msgpack.Decoder(cls) for cls in _CORE_TYPES
+}
+# UUIDs as 16 raw bytes rather than 36-char strings: smaller and cheaper to parse
+_msgpack_encoder = msgspec.msgpack.Encoder(uuid_format="bytes")
+
+# Frame header: payload length as a big-endian unsigned 32-bit int
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def to_json_bytes(obj: Any) -> bytes:
+    """Serialize a core type (or plain JSON data) to JSON bytes.
+
+    Args:
+        obj: A core dataclass instance, or any structure of them
+
+    Returns:
+        UTF-8 encoded JSON, equivalent to ``json.dumps(obj.to_dict())``
+    """
+    return orjson.dumps(obj)
+
+
+def from_json_bytes[T](data: bytes | str, cls: type[T]) -> T:
+    """Deserialize JSON produced by ``to_json_bytes``/``to_dict`` into a core type.
+
+    Args:
+        data: UTF-8 encoded JSON document
+        cls: Core type to decode into (e.g. Situation, Decision)
+
+    Returns:
+        Instance of cls, equivalent to ``cls.from_dict(json.loads(data))``
+
+    Raises:
+        msgspec.ValidationError: If the document does not match cls
+        KeyError: If cls is not a core type
+    """
+    return _JSON_DECODERS[cls].decode(data)
+
+
+def to_msgpack_frame(obj: Any) -> bytes:
+    """Serialize a core type to a length-prefixed MessagePack frame.
+
+    Args:
+        obj: A core dataclass instance, or any structure of them
+
+    Returns:
+        4-byte big-endian payload length followed by the MessagePack payload
+    """
+    payload = _msgpack_encoder.encode(obj)
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def from_msgpack_frame[T](frame: bytes, cls: type[T]) -> T:
+    """Deserialize a frame written by ``to_msgpack_frame`` into a core type.
+
+    Args:
+        frame: Length prefix followed by exactly that many payload bytes
+        cls: Core type to decode into (e.g. Situation, Decision)
+
+    Returns:
+        Instance of cls
+
+    Raises:
+        ValueError: If the frame is truncated or its length prefix is wrong
+        msgspec.ValidationError: If the payload does not match cls
+        KeyError: If cls is not a core type
+    """
+    header_size = _FRAME_HEADER.size
+    if len(frame) < header_size:
+        raise ValueError("Truncated frame: missing length prefix")
+    (length,) = _FRAME_HEADER.unpack_from(frame)
+    if len(frame) - header_size != length:
+        raise ValueError(
+            f"Frame length mismatch: prefix says {length} bytes, got {len(frame) - header_size}"
+        )
+    return _MSGPACK_DECODERS[cls].decode(memoryview(frame)[header_size:])
@@ -0,0 +1,12 @@
+"""Shared fixtures for the Dragonfly test suite."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from dragonfly.service.api.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create test client, shared by every test in the session."""
+    return TestClient(app)
@@ -4,50 +4,130 @@ These tests verify architectural constraints and non-functional requirements.
 """
 
 import ast
+import os
 import sys
 import time
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-from dragonfly.service.api.main import app
+# Located from this file, so the tests do not depend on the working directory
+_CORE_DIR = Path(__file__).resolve().parent.parent / "src" / "dragonfly" / "core"
 
+# Core modules under check (including __init__.py), listed once per session
+_CORE_PY_FILES = tuple(
+    Path(entry.path) for entry in os.scandir(_CORE_DIR) if entry.name.endswith(".py")
+)
 
-def test_core_has_no_external_imports():
+# Already a frozenset; shared rather than copied per test
+_STDLIB_MODULES = sys.stdlib_module_names
+
+# Packages core must not depend on
+_OUTER_LAYERS = ("dragonfly.service", "dragonfly.adapters")
+
+# Package of every module under check; relative imports resolve against it
+_CORE_PACKAGE = "dragonfly.core"
+
+# Statement fields that hold nested statements (ExceptHandler and
+# match_case are reached through handlers/cases and keep theirs in body)
+_NESTED_BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_import_stmts(body):
+    """Yield every Import/ImportFrom statement in a statement list.
+
+    Imports are statements, so only statement bodies (of if/try/with/for/
+    while/match blocks, functions and classes) can contain them; unlike
+    ast.walk this never visits expression subtrees.
+    """
+    for node in body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+        for field in _NESTED_BODY_FIELDS:
+            nested = getattr(node, field, None)
+            if nested:
+                yield from _iter_import_stmts(nested)
+
+
+def _imported_modules(node):
+    """Return the full module names an Import/ImportFrom statement names.
+
+    Relative imports are resolved against the core package, and each name
+    imported from a module is reported as a possible submodule too, so
+    ``from dragonfly import service`` and ``from .. import service`` both
+    yield ``dragonfly.service``.
+    """
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if node.level:
+        base = _CORE_PACKAGE.rsplit(".", node.level - 1)[0]
+        module = f"{base}.{node.module}" if node.module else base
+    else:
+        module = node.module
+    return [module, *(f"{module}.{alias.name}" for alias in node.names)]
+
+
+@pytest.fixture(scope="module")
+def core_import_violations():
+    """Check every core import against all boundary rules in a single pass.
+
+    Each core module is parsed once and each import classified once; the
+    boundary tests only report their share of the violations.
+    """
+    assert _CORE_PY_FILES, f"No core modules found in {_CORE_DIR}"
+    violations = {"external": [], "layering": []}
+
+    for py_file in _CORE_PY_FILES:
+        # ast.parse without its wrapper; the file name shows up in syntax errors
+        tree = compile(
+            py_file.read_bytes(), py_file.name, "exec", ast.PyCF_ONLY_AST, dont_inherit=True
+        )
+        for node in _iter_import_stmts(tree.body):
+            for module in _imported_modules(node):
+                top_level = module.partition(".")[0]
+                if top_level not in _STDLIB_MODULES and top_level != "dragonfly":
+                    violations["external"].append(f"{py_file.name}: imports '{module}'")
+                if module.startswith(_OUTER_LAYERS):
+                    violations["layering"].append(f"{py_file.name}: imports '{module}'")
+
+    return violations
+
+
+def test_core_has_no_external_imports(core_import_violations):
     """Core modules only import from stdlib and dragonfly.core.
     
     This verifies the pure-core architectural constraint.
     """
-    core_path = Path("src/dragonfly/core")
-    stdlib_modules = set(sys.stdlib_module_names)
+    errors = core_import_violations["external"]
+    assert not errors, f"Core import violations: {errors}"
 
-    errors = []
 
-    for py_file in core_path.glob("*.py"):
-        if py_file.name == "__init__.py":
-            continue
+def test_core_does_not_import_service_or_adapters(core_import_violations):
+    """Core modules never import the service or adapter layers.
+
+    Dependencies point inward: service and adapters build on core.
+    """
+    errors = core_import_violations["layering"]
+    assert not errors, f"Core layering violations: {errors}"
 
-        tree = ast.parse(py_file.read_text())
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = alias.name.split(".")[0]
-                    if module not in stdlib_modules and module != "dragonfly":
-                        errors.append(f"{py_file.name}: imports '{alias.name}'")
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module = node.module.split(".")[0]
-                    if module not in stdlib_modules and module != "dragonfly":
-                        errors.append(f"{py_file.name}: imports from '{node.module}'")
 
-    assert not errors, f"Core import violations: {errors}"
+@pytest.mark.parametrize("source", [
+    "from dragonfly.service.api import routes",
+    "from dragonfly import service",
+    "from .. import adapters",
+    "from ..service.runtime import langgraph_runner",
+])
+def test_layering_check_sees_every_import_form(source):
+    """Absolute, package-level and relative imports of outer layers are all caught."""
+    (node,) = ast.parse(source).body
 
+    assert any(module.startswith(_OUTER_LAYERS) for module in _imported_modules(node))
 
-def test_decision_latency_under_500ms():
+
+def test_decision_latency_under_500ms(client):
     """Decisions complete in under 500ms (no LLM latency)."""
-    client = TestClient(app)
-    
+
     request = {
         "tenant_id": "test",
         "goal": "Performance test",
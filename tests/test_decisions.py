@@ -3,16 +3,7 @@
 These tests verify user-visible behaviors of the decision API.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-
-from dragonfly.service.api.main import app
-
-
-@pytest.fixture
-def client():
-    """Create test client."""
-    return TestClient(app)
+from dragonfly.service.api.routes import MAX_BATCH_SIZE
 
 
 def test_prefers_reversible_action(client):
@@ -119,3 +110,107 @@ def test_handles_single_action(client):
     assert response.status_code == 200
     decision = response.json()
     assert decision["selected_action"]["name"] == "Implement compliance"
+
+
+def test_rejects_invalid_situation(client):
+    """Framework rejects a situation missing required fields with 422."""
+    response = client.post("/api/v1/decide", json={
+        "tenant_id": "test",
+        "goal": "Choose deployment strategy",
+    })
+
+    assert response.status_code == 422
+    (error,) = response.json()["detail"]
+    assert error["type"] == "missing"
+    assert error["loc"][0] == "body"
+
+
+def test_rejects_unknown_stakes(client):
+    """Framework rejects a stakes value outside the allowed levels with 422."""
+    response = client.post("/api/v1/decide", json={
+        "tenant_id": "test",
+        "goal": "Choose deployment strategy",
+        "time_horizon": "near",
+        "stakes": "bogus",
+        "observations": [],
+        "candidate_actions": [
+            {"name": "Deploy", "description": "Ship it", "reversibility": "reversible"},
+        ],
+    })
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "stakes"]
+
+
+def test_repeated_situation_gets_fresh_decision(client):
+    """Framework returns the same choice for a repeated situation, as a new decision."""
+    request = {
+        "tenant_id": "test",
+        "goal": "Choose deployment strategy",
+        "time_horizon": "near",
+        "stakes": "medium",
+        "observations": [
+            {"content": "Feature is ready", "source": "ci", "reliability": "high"}
+        ],
+        "candidate_actions": [
+            {"name": "Full rollout", "description": "Deploy to all users", "reversibility": "irreversible"},
+            {"name": "Gradual rollout", "description": "Deploy to 10%", "reversibility": "reversible"},
+        ]
+    }
+
+    first = client.post("/api/v1/decide", json=request).json()
+    second = client.post("/api/v1/decide", json=request).json()
+    uncached = client.post(
+        "/api/v1/decide", json=request, headers={"Cache-Control": "no-cache"}
+    ).json()
+
+    assert second["id"] != first["id"]
+    assert second["situation_id"] != first["situation_id"]
+    assert second["selected_action"]["id"] != first["selected_action"]["id"]
+    for decision in (second, uncached):
+        assert decision["selected_action"]["name"] == first["selected_action"]["name"]
+        assert decision["robustness_basis"] == first["robustness_basis"]
+
+
+def test_decides_batch_in_order(client):
+    """Framework decides each situation of a batch independently, in order."""
+    situation = {
+        "tenant_id": "test",
+        "time_horizon": "near",
+        "stakes": "medium",
+        "observations": [
+            {"content": "Feature is ready", "source": "ci", "reliability": "high"}
+        ],
+    }
+    response = client.post("/api/v1/decide/batch", json=[
+        {**situation, "goal": "Choose deployment strategy", "candidate_actions": [
+            {"name": "Full rollout", "description": "Deploy to all users", "reversibility": "irreversible"},
+            {"name": "Gradual rollout", "description": "Deploy to 10%", "reversibility": "reversible"},
+        ]},
+        {**situation, "goal": "Comply with regulation", "candidate_actions": [
+            {"name": "Implement compliance", "description": "Make changes", "reversibility": "costly"}
+        ]},
+    ])
+
+    assert response.status_code == 200
+    decisions = response.json()
+    assert [d["selected_action"]["name"] for d in decisions] == [
+        "Gradual rollout", "Implement compliance",
+    ]
+
+
+def test_rejects_oversized_batch(client):
+    """Framework rejects a batch over the size limit with 413."""
+    situation = {
+        "tenant_id": "test",
+        "goal": "Choose deployment strategy",
+        "time_horizon": "near",
+        "stakes": "low",
+        "observations": [],
+        "candidate_actions": [
+            {"name": "Gradual rollout", "description": "Deploy to 10%", "reversibility": "reversible"},
+        ],
+    }
+    response = client.post("/api/v1/decide/batch", json=[situation] * (MAX_BATCH_SIZE + 1))
+
+    assert response.status_code == 413
@@ -0,0 +1,97 @@
+"""Functional tests for the decision runner.
+
+These tests verify runner behaviors that the HTTP API does not expose directly.
+"""
+
+import pytest
+
+from dragonfly.core.types import ActionSpec, Observation, Situation
+from dragonfly.service.runtime import langgraph_runner
+from dragonfly.service.runtime.langgraph_runner import DragonflyRunner
+
+
+def _mixed_situation():
+    """Build a fresh situation with warnings, a conflict and a deadline violation."""
+    return Situation(
+        tenant_id="test",
+        goal="Plan inventory",
+        time_horizon="near",
+        stakes="high",
+        observations=[
+            Observation(content="Demand will increase by friday", source="sales", reliability="low"),
+            Observation(content="Demand will decrease 10%", source="market", reliability="high"),
+        ],
+        candidate_actions=[
+            ActionSpec(name="Increase inventory", description="Stock up", reversibility="irreversible"),
+            ActionSpec(name="Order later", description="Wait", reversibility="reversible", time_sensitivity="flexible"),
+            ActionSpec(name="Rent storage", description="Short lease", reversibility="costly"),
+        ],
+    )
+
+
+@pytest.fixture
+def synthesis_calls(monkeypatch):
+    """Record the id of every situation the runner synthesizes a decision for."""
+    calls = []
+    synthesize = langgraph_runner.synthesize
+
+    def counting_synthesize(situation, assessments):
+        calls.append(situation.id)
+        return synthesize(situation, assessments)
+
+    monkeypatch.setattr(langgraph_runner, "synthesize", counting_synthesize)
+    return calls
+
+
+def test_cached_runner_replays_synthesis_for_repeated_situation(synthesis_calls):
+    """A repeated situation reuses the synthesis but is bound to its own ids."""
+    runner = DragonflyRunner(cache_size=8)
+    first_situation, second_situation = _mixed_situation(), _mixed_situation()
+    first = runner.run(first_situation)
+    second = runner.run(second_situation)
+
+    # Only the first run synthesizes; the second is a cache hit
+    assert synthesis_calls == [first_situation.id]
+
+    assert second.id != first.id
+    assert second.situation_id == second_situation.id
+    # The same actions are chosen, taken from the new situation
+    first_actions = first_situation.candidate_actions
+    second_actions = second_situation.candidate_actions
+    selected = first_actions.index(first.selected_action)
+    assert second.selected_action is second_actions[selected]
+    assert [second_actions.index(a) for a in second.alternatives_considered] == [
+        first_actions.index(a) for a in first.alternatives_considered
+    ]
+    assert all(
+        any(a is b for b in second_actions) for a in second.alternatives_considered
+    )
+    assert second.robustness_basis == first.robustness_basis
+    assert [t.condition for t in second.monitoring] == [t.condition for t in first.monitoring]
+
+    # Assessments are made afresh for the new situation, not reused
+    assert len(second.assessments_used) == len(first.assessments_used)
+    assert not set(second.assessments_used) & set(first.assessments_used)
+
+
+def test_runner_does_not_cache_by_default(synthesis_calls):
+    """Library callers get a fresh synthesis unless they opt in to caching."""
+    runner = DragonflyRunner()
+    runner.run(_mixed_situation())
+    runner.run(_mixed_situation())
+
+    assert len(synthesis_calls) == 2
+
+
+def test_graph_runner_matches_direct_runner():
+    """The LangGraph path decides exactly as the default direct pass."""
+    situation = _mixed_situation()
+    direct = DragonflyRunner().run(situation)
+    graph = DragonflyRunner(use_graph=True).run(situation)
+
+    assert direct.monitoring
+    assert graph.selected_action is direct.selected_action
+    assert graph.alternatives_considered == direct.alternatives_considered
+    assert graph.robustness_basis == direct.robustness_basis
+    assert [t.condition for t in graph.monitoring] == [t.condition for t in direct.monitoring]
+    assert len(graph.assessments_used) == len(direct.assessments_used)
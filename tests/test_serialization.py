@@ -0,0 +1,79 @@
+"""Functional tests for serialization of core types at the service boundary.
+
+These tests verify that encoded situations and decisions decode to the same data.
+"""
+
+import struct
+
+import msgspec
+import pytest
+
+from dragonfly.core.types import ActionSpec, Decision, Observation, Situation
+from dragonfly.service.runtime.langgraph_runner import get_runner
+from dragonfly.service.serialization import (
+    from_json_bytes,
+    from_msgpack_frame,
+    to_json_bytes,
+    to_msgpack_frame,
+)
+
+
+@pytest.fixture(scope="module")
+def situation():
+    """Create a situation with nested observations, actions and context."""
+    return Situation(
+        tenant_id="test",
+        goal="Plan inventory",
+        time_horizon="near",
+        stakes="high",
+        observations=[
+            Observation(content="Demand will increase 20%", source="sales", reliability="low"),
+            Observation(content="Demand will decrease 10%", source="market", reliability="medium"),
+        ],
+        candidate_actions=[
+            ActionSpec(name="Increase inventory", description="Stock up", reversibility="irreversible"),
+            ActionSpec(name="Maintain levels", description="Keep current", reversibility="reversible"),
+        ],
+        context={"region": "emea", "weights": [0.5, 0.5]},
+    )
+
+
+def test_json_roundtrip_preserves_situation(situation):
+    """A situation survives a JSON roundtrip unchanged."""
+    decoded = from_json_bytes(to_json_bytes(situation), Situation)
+
+    assert decoded == situation
+    assert decoded.to_dict() == situation.to_dict()
+
+
+def test_json_roundtrip_preserves_decision(situation):
+    """A decision, with its nested actions and monitoring, survives a JSON roundtrip."""
+    decision = get_runner().run(situation)
+    decoded = from_json_bytes(to_json_bytes(decision), Decision)
+
+    assert decoded == decision
+    assert decoded.monitoring
+
+
+def test_msgpack_frame_roundtrip_preserves_situation_and_decision(situation):
+    """Situations and decisions survive a length-prefixed MessagePack roundtrip."""
+    decision = get_runner().run(situation)
+
+    assert from_msgpack_frame(to_msgpack_frame(situation), Situation) == situation
+    assert from_msgpack_frame(to_msgpack_frame(decision), Decision) == decision
+
+
+def test_msgpack_frame_rejects_truncated_frame(situation):
+    """A frame cut short is rejected rather than decoded."""
+    frame = to_msgpack_frame(situation)
+
+    with pytest.raises(ValueError):
+        from_msgpack_frame(frame[:-1], Situation)
+
+
+def test_msgpack_frame_accepts_string_uuids(situation):
+    """Frames holding UUIDs as canonical strings still decode."""
+    payload = msgspec.msgpack.encode(situation)
+    frame = struct.pack(">I", len(payload)) + payload
+
+    assert from_msgpack_frame(frame, Situation) == situation